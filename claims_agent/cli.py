@@ -1,12 +1,16 @@
 """Command-line interface for the claims processing agent."""
 
 import argparse
-import json
+import functools
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-from src.processor import ClaimProcessor
+from src.processor import ClaimProcessor, dumps_json
+
+# File extensions picked up by --folder
+CLAIM_FILE_EXTENSIONS = {".txt", ".pdf", ".md"}
 
 
 def main():
@@ -22,6 +26,9 @@ Examples:
   # Process multiple documents
   python cli.py --folder ./claims/
 
+  # Process a folder with 4 worker processes
+  python cli.py --folder ./claims/ --workers 4
+
   # Process with output file
   python cli.py --file claim.pdf --output result.json
 
@@ -56,6 +63,12 @@ Examples:
         default="json",
         help="Output format (default: json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for --folder processing (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -66,7 +79,7 @@ Examples:
         sys.exit(1)
 
     # Initialize processor
-    processor = ClaimProcessor()
+    processor = _get_processor()
 
     # Process documents
     if args.file:
@@ -86,6 +99,12 @@ Examples:
         display_results(results, args.format)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_processor() -> ClaimProcessor:
+    """Return a shared processor, reused across repeated main() calls."""
+    return ClaimProcessor()
+
+
 def process_single_file(processor: ClaimProcessor, file_path: str, args) -> list:
     """Process a single file."""
     try:
@@ -109,18 +128,21 @@ def process_folder(processor: ClaimProcessor, folder_path: str, args) -> list:
             print(f"Error: Folder not found: {folder_path}", file=sys.stderr)
             sys.exit(1)
 
-        # Find all relevant files
-        file_patterns = ["*.txt", "*.pdf", "*.md"]
-        files = []
-        for pattern in file_patterns:
-            files.extend(folder.glob(pattern))
+        # Find all relevant files in a single directory scan
+        with os.scandir(folder) as entries:
+            files = [
+                entry.path
+                for entry in entries
+                if entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in CLAIM_FILE_EXTENSIONS
+            ]
 
         if not files:
             print(f"Error: No claim documents found in: {folder_path}", file=sys.stderr)
             sys.exit(1)
 
         print(f"Found {len(files)} claim document(s)")
-        results = processor.process_batch([str(f) for f in files])
+        results = processor.process_batch(files, max_workers=args.workers)
         print(f"✓ Successfully processed {len(results)} document(s)")
         return results
     except Exception as e:
@@ -139,7 +161,7 @@ def display_results(results: list, format: str = "json") -> None:
         if format == "pretty":
             display_result_pretty(result)
         else:
-            print(json.dumps(result.to_json_dict(), indent=2))
+            print(dumps_json(result.to_json_dict()).decode("utf-8"))
         print()
 
 
@@ -180,8 +202,8 @@ def save_results(results: list, output_path: str) -> None:
 
     output = [result.to_json_dict() for result in results]
 
-    with open(path, "w") as f:
-        json.dump(output, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(dumps_json(output))
 
 
 if __name__ == "__main__":
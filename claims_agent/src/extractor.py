@@ -2,7 +2,7 @@
 
 import re
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from .models import (
     ClaimData,
     ClaimType,
@@ -12,56 +12,210 @@ from .models import (
     AssetDetails,
 )
 
+# Optional linear-time regex engine (pip install google-re2)
+try:
+    import re2
+
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+except ImportError:
+    re2 = None
+
+
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# A compiled pattern: re.Pattern, or an RE2 regex when re2 is installed
+_CompiledPattern = Any
+
+# Runs of spaces/tabs, or a newline followed by any whitespace (which also
+# swallows blank lines and the indentation of the next line)
+_NORMALIZE_PATTERN = re.compile(r"[ \t]+|\n\s+")
+
+
+def _compile_pattern(pattern: str, flags: int = _FLAGS) -> _CompiledPattern:
+    """
+    Compile a regex pattern once at import time.
+
+    Uses RE2 when it is installed, falling back to the standard re module
+    for patterns RE2 cannot express (e.g. lookaheads).
+    """
+    if re2 is not None:
+        inline_flags = "".join(
+            letter
+            for flag, letter in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"))
+            if flags & flag
+        )
+        try:
+            return re2.compile(
+                f"(?{inline_flags}){pattern}" if inline_flags else pattern,
+                _RE2_OPTIONS,
+            )
+        except re2.error:
+            # Unsupported syntax in RE2; use the backtracking engine instead
+            pass
+    return re.compile(pattern, flags)
+
+
+def _compile(
+    patterns: List[str], flags: int = _FLAGS
+) -> Tuple[_CompiledPattern, ...]:
+    """Compile a list of regex patterns once at import time."""
+    return tuple(_compile_pattern(pattern, flags) for pattern in patterns)
+
+
+def _normalize_whitespace(match: re.Match) -> str:
+    """Replacement for _NORMALIZE_PATTERN: keep a single newline or space."""
+    return "\n" if match.group(0)[0] == "\n" else " "
+
+
+# Pattern definitions for field extraction
+# Optimized for both ACORD forms and plain text documents
+# Every alternative branch of every pattern here and below must contain a
+# _FIELD_MARKERS word, or ASCII text matching that branch is never searched
+_RAW_PATTERNS = {
+    "policy_number": [
+        r"POLICY\s+NUMBER\s*\n\s*([A-Z0-9\-]{5,})",  # ACORD format
+        r"(?:Policy\s*(?:Number|No\.?|#))\s*[:=]?\s*([A-Z0-9\-]+)",
+        r"(?:Policy)\s+([A-Z0-9\-]{6,})",
+    ],
+    "policyholder_name": [
+        r"Name\s+of\s+Policyholder\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']+?)(?:\n)",  # ACORD format - specific label
+        r"Name\s+of\s+(?:Insured|POLICYHOLDER)\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']+?)(?:\n)",
+        r"(?:Policyholder\s+Name|Insured(?:'s)?\s+Name|Named\s+Insured)\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n)",
+        r"(?:Policyholder|Insured)\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n|,|;|Address)",
+    ],
+    "incident_date": [
+        r"DATE\s+OF\s+LOSS[^\n]*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|[A-Za-z]+\s+\d{1,2},\s+\d{4})",  # ACORD format - handle both formats
+        r"(?:Date\s+of\s+Loss)\s*\n\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})",
+        r"(?:Date\s+of\s+(?:Loss|Occurrence|Accident))\s*[:=]?\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})",
+        r"(?:Date\s+of\s+(?:Loss|Occurrence|Accident))\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    ],
+    "incident_time": [
+        r"TIME\s+OF\s+LOSS[^\n]*\n\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",  # ACORD format with full label
+        r"(?:Time)\s*\n\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",
+        r"(?:Time\s+of\s+(?:Loss|Occurrence))\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",
+    ],
+    "incident_location": [
+        r"LOCATION\s+OF\s+LOSS[^\n]*STREET:\s*\n?\s*([^\n]{5,}?)(?:\n|CITY)",  # ACORD format
+        r"(?:Location\s+of\s+(?:Loss|Accident))\s*[:=]?\s*([^\n]+?)(?:\n)",
+        r"(?:Location|Place)\s*[:=]?\s*([^\n]{10,150}?)(?:\n)",
+    ],
+    "asset_type": [
+        r"Year/Make/Model\s*\n\s*([^\n]+?)(?:\n)",  # ACORD format - most specific first
+        r"MAKE\s*\n\s*([A-Za-z0-9\s\-]{2,50}?)\s*(?:\n|YEAR)",  # ACORD format with Make label
+        r"(?:Type\s+of\s+(?:Property|Asset))\s*[:=]?\s*([A-Za-z\s\d]+?)(?:\n|;|,)",
+        r"(?:Property|Asset)\s+(?:Type)\s*[:=]?\s*([A-Za-z\s\-\d]+?)(?:\n|$)",
+    ],
+    "estimated_damage": [
+        r"ESTIMATED\s+DAMAGE\s*\n\s*\$?\s*([\d,\.]+)",  # ACORD format with form label
+        r"(?:Estimated\s+Damage\s+Amount)\s*[:=]?\s*\$?\s*([\d,\.]+)",
+        r"(?:Estimated|Est\.)\s+(?:Damage|Loss)\s*[:=]?\s*\$?\s*([\d,\.]+)",
+        r"Damage\s+Estimate\s*[:=]?\s*\$?\s*([\d,\.]+)",
+    ],
+    "claim_type": [
+        r"(?:Type\s+of\s+Claim)\s*[:=]?\s*([A-Za-z\s]+?)(?:\n)",
+        r"(?:Claim\s+Type)\s*[:=]?\s*([A-Za-z\s\-]+?)(?:\n|$)",
+    ],
+}
+
+
+_EFFECTIVE_DATE_PATTERNS = _compile([
+    r"Policy\s+Effective\s+Date\s*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    r"(?:Effective\s+Date|Policy\s+Effective)\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+])
+
+_EXPIRATION_DATE_PATTERNS = _compile([
+    r"Policy\s+Expiration\s+Date\s*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    r"(?:Expiration\s+Date|Policy\s+Expir(?:es|ation))\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+])
+
+# More flexible time extraction
+_TIME_PATTERNS = _compile([
+    r"(?:Time\s+of\s+(?:Loss|Occurrence))\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
+    r"(?:Time)\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
+])
+
+# Description (longer text block) - multiple variants
+_DESC_PATTERNS = _compile([
+    r"(?:DESCRIPTION\s+OF\s+(?:LOSS|ACCIDENT|INCIDENT))\s*\n\s*([^\n]+(?:\n(?![A-Z\s]+\n)[^\n]+)*)",
+    r"(?:Description\s+of\s+(?:Loss|Accident|Incident))\s*[:=]?\s*([^\n]{20,500}?)(?:\n\n|\n[A-Z])",
+    r"(?:What\s+happened|Description)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
+])
+
+# Asset ID/VIN
+_VIN_PATTERNS = _compile([
+    r"Vehicle\s+Identification\s+Number\s+\(VIN\)\s*\n\s*([A-Z0-9]{10,})",  # ACORD format
+    r"(?:VIN|Asset\s+ID)\s*\n\s*([A-Z0-9\-]{6,})",  # Simple format with newline
+    r"(?:VIN|Asset\s+ID)\s*[:=]?\s*([A-Z0-9\-]{6,})",  # Inline format
+])
+
+# Claimant information with more specific patterns
+_CLAIMANT_PATTERNS = _compile([
+    r"Claimant\s+Name\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']{2,50}?)(?:\n)",  # ACORD format
+    r"(?:Claimant|Named\s+Insured)\s*[:=]\s*([A-Za-z\s\.\-\']+?)(?:\n|,)",
+])
+_CLAIMANT_PHONE_PATTERN = _compile_pattern(
+    r"Contact\s+Phone\s*\n\s*([\d\-]+)", re.IGNORECASE
+)
+_CLAIMANT_EMAIL_PATTERN = _compile_pattern(
+    r"Contact\s+Email\s*\n\s*([^\n]+)", re.IGNORECASE
+)
+
+# Third party information
+_THIRD_PARTY_PATTERNS = _compile([
+    r"Third\s+Party\s+Driver\s+Name\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']{2,50}?)(?:\n)",  # ACORD format
+    r"(?:Third\s+Party|Other\s+Driver)\s+Name\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n)",
+])
+_THIRD_PARTY_PHONE_PATTERN = _compile_pattern(
+    r"Third\s+Party\s+(?:Telephone|Phone)\s*\n\s*([\d\-]+)", re.IGNORECASE
+)
+
+# Common document references
+_ATTACHMENT_PATTERNS = _compile(
+    [
+        r"ATTACHMENTS\s*\n\s*([^\n]{10,})",  # ACORD format
+        r"(?:Attachments?|Exhibits?|Documents?)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
+        r"(?:Photos?|Images?|Documents?)\s+(?:attached|included)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
+    ],
+    re.IGNORECASE,
+)
+
+# Claim type keywords in priority order, for inferring the type from the
+# whole document and for classifying an explicit "Claim Type" value
+_INFERRED_CLAIM_KEYWORDS = (
+    ("injury", ClaimType.BODILY_INJURY),
+    ("bodily", ClaimType.BODILY_INJURY),
+    ("theft", ClaimType.THEFT),
+    ("collision", ClaimType.COLLISION),
+    ("comprehensive", ClaimType.COMPREHENSIVE),
+    ("property", ClaimType.PROPERTY_DAMAGE),
+)
+_DECLARED_CLAIM_KEYWORDS = (
+    ("injury", ClaimType.BODILY_INJURY),
+    ("theft", ClaimType.THEFT),
+    ("collision", ClaimType.COLLISION),
+    ("comprehensive", ClaimType.COMPREHENSIVE),
+    ("property", ClaimType.PROPERTY_DAMAGE),
+    ("damage", ClaimType.PROPERTY_DAMAGE),
+    ("liability", ClaimType.LIABILITY),
+)
+
+# Lowercase words of which every extraction pattern and claim type keyword
+# needs at least one; text containing none of them cannot yield any field
+_FIELD_MARKERS = (
+    "policy", "insured", "claim", "contact", "loss", "occurrence", "accident",
+    "time", "location", "place", "make", "property", "asset", "damage",
+    "effective", "expir", "description", "happened", "vin", "party", "driver",
+    "attach", "exhibit", "document", "photo", "image", "injury", "bodily",
+    "theft", "collision", "comprehensive",
+)
+
 
 class FieldExtractor:
     """Extracts structured fields from unstructured claim documents."""
 
-    # Pattern definitions for field extraction
-    # Optimized for both ACORD forms and plain text documents
     PATTERNS = {
-        "policy_number": [
-            r"POLICY\s+NUMBER\s*\n\s*([A-Z0-9\-]{5,})",  # ACORD format
-            r"(?:Policy\s*(?:Number|No\.?|#))\s*[:=]?\s*([A-Z0-9\-]+)",
-            r"(?:Policy)\s+([A-Z0-9\-]{6,})",
-        ],
-        "policyholder_name": [
-            r"Name\s+of\s+Policyholder\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']+?)(?:\n)",  # ACORD format - specific label
-            r"Name\s+of\s+(?:Insured|POLICYHOLDER)\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']+?)(?:\n)",
-            r"(?:Policyholder\s+Name|Insured(?:'s)?\s+Name|Named\s+Insured)\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n)",
-            r"(?:Policyholder|Insured)\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n|,|;|Address)",
-        ],
-        "incident_date": [
-            r"DATE\s+OF\s+LOSS[^\n]*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|[A-Za-z]+\s+\d{1,2},\s+\d{4})",  # ACORD format - handle both formats
-            r"(?:Date\s+of\s+Loss)\s*\n\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})",
-            r"(?:Date\s+of\s+(?:Loss|Occurrence|Accident))\s*[:=]?\s*([A-Za-z]+\s+\d{1,2},\s+\d{4})",
-            r"(?:Date\s+of\s+(?:Loss|Occurrence|Accident))\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-        ],
-        "incident_time": [
-            r"TIME\s+OF\s+LOSS[^\n]*\n\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",  # ACORD format with full label
-            r"(?:Time)\s*\n\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",
-            r"(?:Time\s+of\s+(?:Loss|Occurrence))\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?)",
-        ],
-        "incident_location": [
-            r"LOCATION\s+OF\s+LOSS[^\n]*STREET:\s*\n?\s*([^\n]{5,}?)(?:\n|CITY)",  # ACORD format
-            r"(?:Location\s+of\s+(?:Loss|Accident))\s*[:=]?\s*([^\n]+?)(?:\n)",
-            r"(?:Location|Place)\s*[:=]?\s*([^\n]{10,150}?)(?:\n)",
-        ],
-        "asset_type": [
-            r"Year/Make/Model\s*\n\s*([^\n]+?)(?:\n)",  # ACORD format - most specific first
-            r"MAKE\s*\n\s*([A-Za-z0-9\s\-]{2,50}?)\s*(?:\n|YEAR)",  # ACORD format with Make label
-            r"(?:Type\s+of\s+(?:Property|Asset))\s*[:=]?\s*([A-Za-z\s\d]+?)(?:\n|;|,)",
-            r"(?:Property|Asset)\s+(?:Type)\s*[:=]?\s*([A-Za-z\s\-\d]+?)(?:\n|$)",
-        ],
-        "estimated_damage": [
-            r"ESTIMATED\s+DAMAGE\s*\n\s*\$?\s*([\d,\.]+)",  # ACORD format with form label
-            r"(?:Estimated\s+Damage\s+Amount)\s*[:=]?\s*\$?\s*([\d,\.]+)",
-            r"(?:Estimated|Est\.)\s+(?:Damage|Loss)\s*[:=]?\s*\$?\s*([\d,\.]+)",
-            r"Damage\s+Estimate\s*[:=]?\s*\$?\s*([\d,\.]+)",
-        ],
-        "claim_type": [
-            r"(?:Type\s+of\s+Claim)\s*[:=]?\s*([A-Za-z\s]+?)(?:\n)",
-            r"(?:Claim\s+Type)\s*[:=]?\s*([A-Za-z\s\-]+?)(?:\n|$)",
-        ],
+        name: _compile(patterns) for name, patterns in _RAW_PATTERNS.items()
     }
 
     # Thresholds for confidence scoring
@@ -84,6 +238,18 @@ class FieldExtractor:
         # Normalize text
         normalized_text = self._normalize_text(text)
 
+        # Skip the pattern battery for documents with no field markers at
+        # all. Only applied to ASCII text, where str.lower() agrees with the
+        # patterns' re.IGNORECASE matching.
+        if normalized_text.isascii():
+            text_lower = normalized_text.lower()
+            if not any(marker in text_lower for marker in _FIELD_MARKERS):
+                claim_data = ClaimData()
+                claim_data.extraction_confidence = self._calculate_confidence_scores(
+                    claim_data
+                )
+                return claim_data
+
         claim_data = ClaimData()
 
         # Extract policy information
@@ -101,8 +267,9 @@ class FieldExtractor:
         # Extract parties involved
         claim_data.involved_parties = self._extract_parties(normalized_text)
 
-        # Extract damage estimate
-        claim_data.initial_estimate = self._extract_damage_estimate(normalized_text)
+        # Initial estimate comes from the same patterns as the asset damage
+        # estimate, so reuse that value instead of scanning the text again
+        claim_data.initial_estimate = claim_data.asset_details.estimated_damage
 
         # Extract attachments (by looking for file references)
         claim_data.attachments = self._extract_attachments(normalized_text)
@@ -116,61 +283,46 @@ class FieldExtractor:
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for consistent extraction."""
-        # Remove extra whitespace but preserve line breaks
-        text = re.sub(r"[ \t]+", " ", text)  # Collapse spaces/tabs only
-        text = re.sub(r"\n\s+", "\n", text)  # Remove leading whitespace on new lines
-        text = re.sub(r"\n{3,}", "\n\n", text)  # Collapse multiple blank lines
-        return text
+        # Remove extra whitespace but preserve line breaks, in a single pass
+        return _NORMALIZE_PATTERN.sub(_normalize_whitespace, text)
 
+    @staticmethod
     def _extract_field(
-        self, text: str, patterns: List[str]
-    ) -> Tuple[Optional[str], float]:
+        text: str, patterns: Tuple[_CompiledPattern, ...]
+    ) -> Optional[str]:
         """
         Extract a field using regex patterns.
 
         Args:
             text: Input text
-            patterns: List of regex patterns to try
+            patterns: Compiled regex patterns to try, in priority order
 
         Returns:
-            Tuple of (extracted_value, confidence_score)
+            Extracted value, or None if no pattern matches
         """
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
-                value = match.group(1).strip()
-                # Confidence is higher if it matches earlier patterns
-                confidence = 0.95
-                return value, confidence
-        return None, 0.0
+                return match.group(1).strip()
+        return None
 
     def _extract_policy_info(self, text: str) -> PolicyInfo:
         """Extract policy-related information."""
         info = PolicyInfo()
 
-        policy_number, conf = self._extract_field(text, self.PATTERNS["policy_number"])
+        policy_number = self._extract_field(text, self.PATTERNS["policy_number"])
         info.policy_number = policy_number
 
-        policyholder, conf = self._extract_field(
+        policyholder = self._extract_field(
             text, self.PATTERNS["policyholder_name"]
         )
         info.policyholder_name = policyholder
 
-        # Try to find effective dates
-        effective_date_patterns = [
-            r"Policy\s+Effective\s+Date\s*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            r"(?:Effective\s+Date|Policy\s+Effective)\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-        ]
-        effective_date, conf = self._extract_field(text, effective_date_patterns)
+        effective_date = self._extract_field(text, _EFFECTIVE_DATE_PATTERNS)
         if effective_date:
             info.policy_effective_date = effective_date
 
-        # Try to find expiration dates
-        expiration_date_patterns = [
-            r"Policy\s+Expiration\s+Date\s*\n\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            r"(?:Expiration\s+Date|Policy\s+Expir(?:es|ation))\s*[:=]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-        ]
-        expiration_date, conf = self._extract_field(text, expiration_date_patterns)
+        expiration_date = self._extract_field(text, _EXPIRATION_DATE_PATTERNS)
         if expiration_date:
             info.policy_expiration_date = expiration_date
 
@@ -180,29 +332,18 @@ class FieldExtractor:
         """Extract incident-related information."""
         info = IncidentInfo()
 
-        incident_date, conf = self._extract_field(text, self.PATTERNS["incident_date"])
+        incident_date = self._extract_field(text, self.PATTERNS["incident_date"])
         info.incident_date = incident_date
 
-        # More flexible time extraction
-        time_patterns = [
-            r"(?:Time\s+of\s+(?:Loss|Occurrence))\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
-            r"(?:Time)\s*[:=]?\s*(\d{1,2}:\d{2}\s*(?:AM|PM|am|pm))",
-        ]
-        incident_time, conf = self._extract_field(text, time_patterns)
+        incident_time = self._extract_field(text, _TIME_PATTERNS)
         info.incident_time = incident_time
 
-        incident_location, conf = self._extract_field(
+        incident_location = self._extract_field(
             text, self.PATTERNS["incident_location"]
         )
         info.incident_location = incident_location
 
-        # Extract description (longer text block) - multiple variants
-        desc_patterns = [
-            r"(?:DESCRIPTION\s+OF\s+(?:LOSS|ACCIDENT|INCIDENT))\s*\n\s*([^\n]+(?:\n(?![A-Z\s]+\n)[^\n]+)*)",
-            r"(?:Description\s+of\s+(?:Loss|Accident|Incident))\s*[:=]?\s*([^\n]{20,500}?)(?:\n\n|\n[A-Z])",
-            r"(?:What\s+happened|Description)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
-        ]
-        description, conf = self._extract_field(text, desc_patterns)
+        description = self._extract_field(text, _DESC_PATTERNS)
         info.incident_description = description
 
         return info
@@ -211,20 +352,14 @@ class FieldExtractor:
         """Extract asset-related information."""
         details = AssetDetails()
 
-        asset_type, conf = self._extract_field(text, self.PATTERNS["asset_type"])
+        asset_type = self._extract_field(text, self.PATTERNS["asset_type"])
         details.asset_type = asset_type
 
-        # Extract asset ID/VIN
-        vin_patterns = [
-            r"Vehicle\s+Identification\s+Number\s+\(VIN\)\s*\n\s*([A-Z0-9]{10,})",  # ACORD format
-            r"(?:VIN|Asset\s+ID)\s*\n\s*([A-Z0-9\-]{6,})",  # Simple format with newline
-            r"(?:VIN|Asset\s+ID)\s*[:=]?\s*([A-Z0-9\-]{6,})",  # Inline format
-        ]
-        asset_id, conf = self._extract_field(text, vin_patterns)
+        asset_id = self._extract_field(text, _VIN_PATTERNS)
         if asset_id:
             details.asset_id = asset_id
 
-        damage_estimate, conf = self._extract_field(
+        damage_estimate = self._extract_field(
             text, self.PATTERNS["estimated_damage"]
         )
         if damage_estimate:
@@ -239,103 +374,58 @@ class FieldExtractor:
 
     def _extract_claim_type(self, text: str) -> ClaimType:
         """Classify the claim type."""
-        claim_type_str, conf = self._extract_field(text, self.PATTERNS["claim_type"])
+        claim_type_str = self._extract_field(text, self.PATTERNS["claim_type"])
 
         if not claim_type_str:
             # Infer from context
-            if "injury" in text.lower() or "bodily" in text.lower():
-                return ClaimType.BODILY_INJURY
-            elif "theft" in text.lower():
-                return ClaimType.THEFT
-            elif "collision" in text.lower():
-                return ClaimType.COLLISION
-            elif "comprehensive" in text.lower():
-                return ClaimType.COMPREHENSIVE
-            elif "property" in text.lower():
-                return ClaimType.PROPERTY_DAMAGE
-            return ClaimType.UNKNOWN
-
-        claim_type_lower = claim_type_str.lower()
-        if "injury" in claim_type_lower:
-            return ClaimType.BODILY_INJURY
-        elif "theft" in claim_type_lower:
-            return ClaimType.THEFT
-        elif "collision" in claim_type_lower:
-            return ClaimType.COLLISION
-        elif "comprehensive" in claim_type_lower:
-            return ClaimType.COMPREHENSIVE
-        elif "property" in claim_type_lower or "damage" in claim_type_lower:
-            return ClaimType.PROPERTY_DAMAGE
-        elif "liability" in claim_type_lower:
-            return ClaimType.LIABILITY
+            return self._match_claim_keywords(text.lower(), _INFERRED_CLAIM_KEYWORDS)
+
+        return self._match_claim_keywords(
+            claim_type_str.lower(), _DECLARED_CLAIM_KEYWORDS
+        )
 
+    def _match_claim_keywords(
+        self, text_lower: str, keywords: Tuple[Tuple[str, ClaimType], ...]
+    ) -> ClaimType:
+        """Return the claim type of the first keyword found in the text."""
+        for keyword, claim_type in keywords:
+            if keyword in text_lower:
+                return claim_type
         return ClaimType.UNKNOWN
 
     def _extract_parties(self, text: str) -> List[InvolvedParty]:
         """Extract involved parties information."""
         parties = []
 
-        # Look for claimant information with more specific patterns
-        claimant_patterns = [
-            r"Claimant\s+Name\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']{2,50}?)(?:\n)",  # ACORD format
-            r"(?:Claimant|Named\s+Insured)\s*[:=]\s*([A-Za-z\s\.\-\']+?)(?:\n|,)",
-        ]
-        claimant, conf = self._extract_field(text, claimant_patterns)
+        claimant = self._extract_field(text, _CLAIMANT_PATTERNS)
         if claimant:
             party = InvolvedParty(name=claimant, relationship="claimant")
             # Try to find contact info nearby
-            phone_pattern = r"Contact\s+Phone\s*\n\s*([\d\-]+)"
-            phone_match = re.search(phone_pattern, text, re.IGNORECASE)
+            phone_match = _CLAIMANT_PHONE_PATTERN.search(text)
             if phone_match:
                 party.contact_phone = phone_match.group(1).strip()
             
-            email_pattern = r"Contact\s+Email\s*\n\s*([^\n]+)"
-            email_match = re.search(email_pattern, text, re.IGNORECASE)
+            email_match = _CLAIMANT_EMAIL_PATTERN.search(text)
             if email_match:
                 party.contact_email = email_match.group(1).strip()
             parties.append(party)
 
-        # Look for third party information
-        third_party_patterns = [
-            r"Third\s+Party\s+Driver\s+Name\s*\n\s*([A-Za-z][A-Za-z\s\.\-\']{2,50}?)(?:\n)",  # ACORD format
-            r"(?:Third\s+Party|Other\s+Driver)\s+Name\s*[:=]?\s*([A-Za-z\s\.\-\']+?)(?:\n)",
-        ]
-        third_party, conf = self._extract_field(text, third_party_patterns)
+        third_party = self._extract_field(text, _THIRD_PARTY_PATTERNS)
         if third_party:
             party = InvolvedParty(name=third_party, relationship="third_party")
             # Try to find third party contact
-            third_phone_pattern = r"Third\s+Party\s+(?:Telephone|Phone)\s*\n\s*([\d\-]+)"
-            third_phone_match = re.search(third_phone_pattern, text, re.IGNORECASE)
+            third_phone_match = _THIRD_PARTY_PHONE_PATTERN.search(text)
             if third_phone_match:
                 party.contact_phone = third_phone_match.group(1).strip()
             parties.append(party)
 
         return parties
 
-    def _extract_damage_estimate(self, text: str) -> Optional[float]:
-        """Extract initial damage estimate."""
-        estimate_str, conf = self._extract_field(
-            text, self.PATTERNS["estimated_damage"]
-        )
-        if estimate_str:
-            try:
-                return float(estimate_str.replace(",", "").replace("$", ""))
-            except ValueError:
-                pass
-        return None
-
     def _extract_attachments(self, text: str) -> List[str]:
         """Extract attachment references."""
         attachments = []
-        # Look for common document references
-        patterns = [
-            r"ATTACHMENTS\s*\n\s*([^\n]{10,})",  # ACORD format
-            r"(?:Attachments?|Exhibits?|Documents?)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
-            r"(?:Photos?|Images?|Documents?)\s+(?:attached|included)\s*[:=]?\s*([^\n]{20,}?)(?:\n|$)",
-        ]
-        for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in _ATTACHMENT_PATTERNS:
+            for match in pattern.finditer(text):
                 attachment = match.group(1).strip()
                 if attachment:
                     # Split comma-separated attachments
@@ -343,7 +433,7 @@ class FieldExtractor:
                         attachments.extend([a.strip() for a in attachment.split(",")])
                     else:
                         attachments.append(attachment)
-        return list(set(attachments))  # Remove duplicates
+        return list(dict.fromkeys(attachments))  # Remove duplicates, keep order
 
     def _calculate_confidence_scores(self, claim_data: ClaimData) -> Dict[str, float]:
         """Calculate confidence scores for each extracted field."""
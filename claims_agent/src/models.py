@@ -1,10 +1,14 @@
 """Data models for insurance claims processing."""
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Literal
 from enum import Enum
 from datetime import datetime
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ClaimType(str, Enum):
     """Enumeration of claim types."""
@@ -26,7 +30,7 @@ class ClaimRoute(str, Enum):
     SPECIALIST_QUEUE = "specialist_queue"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PolicyInfo:
     """Policy information fields."""
     policy_number: Optional[str] = None
@@ -35,8 +39,18 @@ class PolicyInfo:
     policy_expiration_date: Optional[str] = None
     insurance_company: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary format."""
+        return {
+            "policy_number": self.policy_number,
+            "policyholder_name": self.policyholder_name,
+            "policy_effective_date": self.policy_effective_date,
+            "policy_expiration_date": self.policy_expiration_date,
+            "insurance_company": self.insurance_company,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class IncidentInfo:
     """Incident information fields."""
     incident_date: Optional[str] = None
@@ -45,8 +59,18 @@ class IncidentInfo:
     incident_description: Optional[str] = None
     weather_conditions: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary format."""
+        return {
+            "incident_date": self.incident_date,
+            "incident_time": self.incident_time,
+            "incident_location": self.incident_location,
+            "incident_description": self.incident_description,
+            "weather_conditions": self.weather_conditions,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class InvolvedParty:
     """Details of an involved party."""
     name: Optional[str] = None
@@ -55,8 +79,18 @@ class InvolvedParty:
     contact_email: Optional[str] = None
     address: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary format."""
+        return {
+            "name": self.name,
+            "relationship": self.relationship,
+            "contact_phone": self.contact_phone,
+            "contact_email": self.contact_email,
+            "address": self.address,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class AssetDetails:
     """Asset information fields."""
     asset_type: Optional[str] = None
@@ -65,8 +99,18 @@ class AssetDetails:
     estimated_damage: Optional[float] = None
     damage_description: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary format."""
+        return {
+            "asset_type": self.asset_type,
+            "asset_id": self.asset_id,
+            "asset_description": self.asset_description,
+            "estimated_damage": self.estimated_damage,
+            "damage_description": self.damage_description,
+        }
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClaimData:
     """Complete claim data structure."""
     claim_type: ClaimType = ClaimType.UNKNOWN
@@ -82,10 +126,10 @@ class ClaimData:
     def to_dict(self) -> Dict:
         """Convert to dictionary format."""
         return {
-            "policy_info": asdict(self.policy_info),
-            "incident_info": asdict(self.incident_info),
-            "involved_parties": [asdict(party) for party in self.involved_parties],
-            "asset_details": asdict(self.asset_details),
+            "policy_info": self.policy_info.to_dict(),
+            "incident_info": self.incident_info.to_dict(),
+            "involved_parties": [party.to_dict() for party in self.involved_parties],
+            "asset_details": self.asset_details.to_dict(),
             "claim_type": self.claim_type.value,
             "initial_estimate": self.initial_estimate,
             "attachments": self.attachments,
@@ -94,16 +138,17 @@ class ClaimData:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RoutingDecision:
     """Routing decision output."""
     recommended_route: ClaimRoute
     reasoning: str
     flags: List[str] = field(default_factory=list)
     confidence_score: float = 0.8
+    missing_fields: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClaimProcessingResult:
     """Final output of claim processing."""
     extracted_fields: Dict
@@ -1,13 +1,102 @@
 """Main claim processing orchestrator."""
 
 import json
-from typing import Dict, Union
-from pathlib import Path
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Callable, Dict, Optional, Union
 
 from .models import ClaimProcessingResult, ClaimData
 from .extractor import FieldExtractor
 from .router import ClaimRouter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _load_pdf_text_extractor() -> Callable[[str], str]:
+    """
+    Resolve the best installed PDF backend once.
+
+    Returns a function mapping a PDF path to its text. Nothing is cached
+    while no backend is installed, so a later install is still picked up.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pass
+    else:
+        def extract_with_pdfium(file_path: str) -> str:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                parts = [page.get_textpage().get_text_range() for page in pdf]
+            finally:
+                pdf.close()
+            # PDFium separates lines with CRLF
+            return "\n".join(parts).replace("\r\n", "\n")
+
+        return extract_with_pdfium
+
+    try:
+        # Fallback to pdfplumber (slower, layout-aware)
+        import pdfplumber
+    except ImportError:
+        pass
+    else:
+        def extract_with_pdfplumber(file_path: str) -> str:
+            with pdfplumber.open(file_path) as pdf:
+                return "".join(page.extract_text() or "" for page in pdf.pages)
+
+        return extract_with_pdfplumber
+
+    try:
+        # Fallback to PyPDF2
+        from PyPDF2 import PdfReader
+    except ImportError:
+        raise ImportError(
+            "Please install pypdfium2, pdfplumber or PyPDF2 for PDF support: "
+            "pip install pypdfium2"
+        )
+
+    def extract_with_pypdf2(file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            pdf_reader = PdfReader(f)
+            return "".join(page.extract_text() for page in pdf_reader.pages)
+
+    return extract_with_pypdf2
+
+
+# Batches smaller than this are processed serially, since starting worker
+# processes costs more than it saves
+MIN_PARALLEL_BATCH = 10
+
+# Processor used by a batch worker process, installed by _init_worker
+_worker_processor = None
+
+
+def _init_worker(processor: "ClaimProcessor") -> None:
+    """Install the processor a worker process uses for all its tasks."""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _process_in_worker(
+    file_path: str, processing_timestamp: Optional[str] = None
+) -> Optional[ClaimProcessingResult]:
+    """Process one file in a worker process."""
+    return _worker_processor._process_file_safe(file_path, processing_timestamp)
+
 
 class ClaimProcessor:
     """Orchestrates the full claim processing pipeline."""
@@ -16,13 +105,19 @@ class ClaimProcessor:
         """Initialize the processor with extractor and router."""
         self.extractor = FieldExtractor()
         self.router = ClaimRouter()
+        # Output directories already created by export_to_file
+        self._known_dirs = set()
 
-    def process_document(self, text: str) -> ClaimProcessingResult:
+    def process_document(
+        self, text: str, processing_timestamp: Optional[str] = None
+    ) -> ClaimProcessingResult:
         """
         Process a claim document from text.
 
         Args:
             text: Raw text from FNOL document
+            processing_timestamp: ISO timestamp to stamp on the result
+                (defaults to now)
 
         Returns:
             ClaimProcessingResult with extraction, routing, and reasoning
@@ -30,97 +125,100 @@ class ClaimProcessor:
         # Step 1: Extract claim information
         claim_data = self.extractor.extract_from_text(text)
 
-        # Step 2: Determine routing
+        # Step 2: Determine routing (also identifies missing fields)
         routing_decision = self.router.route_claim(claim_data)
 
-        # Step 3: Identify missing fields
-        missing_fields = self.router._identify_missing_fields(claim_data)
-
-        # Step 4: Build result
+        # Step 3: Build result
         result = ClaimProcessingResult(
             extracted_fields=claim_data.to_dict(),
-            missing_fields=missing_fields,
+            missing_fields=routing_decision.missing_fields,
             recommended_route=routing_decision.recommended_route.value,
             routing_reasoning=routing_decision.reasoning,
             flags=routing_decision.flags,
             confidence_score=routing_decision.confidence_score,
+            processing_timestamp=processing_timestamp or datetime.now().isoformat(),
         )
 
         return result
 
-    def process_file(self, file_path: str) -> ClaimProcessingResult:
+    def process_file(
+        self, file_path: str, processing_timestamp: Optional[str] = None
+    ) -> ClaimProcessingResult:
         """
         Process a claim document from a file.
 
         Args:
             file_path: Path to the document file
+            processing_timestamp: ISO timestamp to stamp on the result
+                (defaults to now)
 
         Returns:
             ClaimProcessingResult
         """
-        path = Path(file_path)
-        
         # For PDF files, we would typically use a PDF library
         # For now, this handles plain text files
-        if path.suffix.lower() == ".pdf":
+        if os.path.splitext(file_path)[1].lower() == ".pdf":
             text = self._extract_text_from_pdf(file_path)
         else:
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
+            # Read raw bytes and decode once, skipping the text-mode wrapper
+            with open(file_path, "rb") as f:
+                text = f.read().decode("utf-8")
+            # Keep text-mode universal newline handling
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-        return self.process_document(text)
+        return self.process_document(text, processing_timestamp)
 
     def _extract_text_from_pdf(self, file_path: str) -> str:
         """
         Extract text from PDF file.
-        
-        Requires: pip install PyPDF2 or pdfplumber
+
+        Requires: pip install pypdfium2, pdfplumber or PyPDF2
         """
-        try:
-            import pdfplumber
-            
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-            return text
-        except ImportError:
-            # Fallback to PyPDF2
-            try:
-                from PyPDF2 import PdfReader
-                
-                text = ""
-                with open(file_path, "rb") as f:
-                    pdf_reader = PdfReader(f)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text()
-                return text
-            except ImportError:
-                raise ImportError(
-                    "Please install PyPDF2 or pdfplumber for PDF support: "
-                    "pip install PyPDF2 pdfplumber"
-                )
+        return _load_pdf_text_extractor()(file_path)
 
-    def process_batch(self, file_paths: list) -> list:
+    def process_batch(self, file_paths: list, max_workers: int = 1) -> list:
         """
         Process multiple claim documents.
 
         Args:
             file_paths: List of file paths to process
+            max_workers: Number of worker processes (1 processes serially)
 
         Returns:
-            List of ClaimProcessingResult objects
+            List of ClaimProcessingResult objects, in input order
         """
-        results = []
-        for file_path in file_paths:
-            try:
-                result = self.process_file(file_path)
-                results.append(result)
-            except Exception as e:
-                # Log error but continue processing
-                print(f"Error processing {file_path}: {str(e)}")
-                continue
-        return results
+        # One timestamp for the whole batch
+        timestamp = datetime.now().isoformat()
+        if max_workers > 1 and len(file_paths) >= MIN_PARALLEL_BATCH:
+            workers = min(max_workers, len(file_paths))
+            # Each worker unpickles this processor once and reuses it
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self,)
+            ) as executor:
+                outcomes = list(
+                    executor.map(
+                        partial(_process_in_worker, processing_timestamp=timestamp),
+                        file_paths,
+                        chunksize=max(1, len(file_paths) // (4 * workers)),
+                    )
+                )
+        else:
+            outcomes = [
+                self._process_file_safe(file_path, timestamp) for file_path in file_paths
+            ]
+        return [result for result in outcomes if result is not None]
+
+    def _process_file_safe(
+        self, file_path: str, processing_timestamp: Optional[str] = None
+    ) -> Optional[ClaimProcessingResult]:
+        """Process a single file, logging errors instead of raising."""
+        try:
+            return self.process_file(file_path, processing_timestamp)
+        except Exception as e:
+            # Log error but continue processing
+            print(f"Error processing {file_path}: {str(e)}")
+            return None
 
     def export_result(
         self, result: ClaimProcessingResult, format: str = "json"
@@ -136,7 +234,7 @@ class ClaimProcessor:
             Formatted result
         """
         if format == "json":
-            return json.dumps(result.to_json_dict(), indent=2)
+            return dumps_json(result.to_json_dict()).decode("utf-8")
         elif format == "dict":
             return result.to_json_dict()
         else:
@@ -152,8 +250,18 @@ class ClaimProcessor:
             result: ClaimProcessingResult to export
             output_path: Path to output file
         """
-        path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        directory = os.path.abspath(os.path.dirname(output_path) or ".")
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
 
-        with open(path, "w") as f:
-            f.write(self.export_result(result, format="json"))
+        # Write the serialized bytes directly, skipping a str round-trip
+        data = dumps_json(result.to_json_dict())
+        try:
+            f = open(output_path, "wb")
+        except FileNotFoundError:
+            # The directory was removed after it was created; recreate it
+            os.makedirs(directory, exist_ok=True)
+            f = open(output_path, "wb")
+        with f:
+            f.write(data)
@@ -1,8 +1,21 @@
 """Claim routing logic based on extracted information."""
 
+from operator import attrgetter
 from typing import List, Tuple
 from .models import ClaimData, ClaimRoute, RoutingDecision, ClaimType
 
+# Mandatory fields, each paired with a getter that reads it from a ClaimData
+_MANDATORY_FIELDS = (
+    ("policy_number", attrgetter("policy_info.policy_number")),
+    ("policyholder_name", attrgetter("policy_info.policyholder_name")),
+    ("incident_date", attrgetter("incident_info.incident_date")),
+    ("incident_location", attrgetter("incident_info.incident_location")),
+    ("incident_description", attrgetter("incident_info.incident_description")),
+    ("asset_type", attrgetter("asset_details.asset_type")),
+    ("estimated_damage", attrgetter("asset_details.estimated_damage")),
+    ("claim_type", lambda claim_data: claim_data.claim_type != ClaimType.UNKNOWN),
+)
+
 
 class ClaimRouter:
     """Routes claims to appropriate processing queues based on analysis."""
@@ -51,12 +64,17 @@ class ClaimRouter:
             reasoning_parts.append("Bodily injury claims require specialist review")
 
         # Check damage amount
-        damage_route, damage_reasoning = self._route_by_damage(claim_data)
-        if damage_reasoning:
-            reasoning_parts.append(damage_reasoning)
+        damage = claim_data.asset_details.estimated_damage
+        fast_track_eligible = bool(damage) and damage < self.FAST_TRACK_THRESHOLD
+        if fast_track_eligible:
+            reasoning_parts.append(
+                f"Estimated damage (${damage:,.2f}) qualifies for fast-track processing"
+            )
 
         # Determine final route
-        route, confidence = self._determine_route(claim_data, flags, missing_fields)
+        route, confidence = self._determine_route(
+            claim_data, bool(fraud_flags), missing_fields, fast_track_eligible
+        )
 
         final_reasoning = " | ".join(reasoning_parts) if reasoning_parts else "Standard processing route"
 
@@ -65,40 +83,27 @@ class ClaimRouter:
             reasoning=final_reasoning,
             flags=flags,
             confidence_score=confidence,
+            missing_fields=missing_fields,
         )
 
     def _identify_missing_fields(self, claim_data: ClaimData) -> List[str]:
         """Identify mandatory fields that are missing."""
-        missing = []
-        mandatory = {
-            "policy_number": claim_data.policy_info.policy_number,
-            "policyholder_name": claim_data.policy_info.policyholder_name,
-            "incident_date": claim_data.incident_info.incident_date,
-            "incident_location": claim_data.incident_info.incident_location,
-            "incident_description": claim_data.incident_info.incident_description,
-            "asset_type": claim_data.asset_details.asset_type,
-            "estimated_damage": claim_data.asset_details.estimated_damage,
-            "claim_type": claim_data.claim_type != ClaimType.UNKNOWN,
-        }
-
-        for field, value in mandatory.items():
-            if not value:
-                missing.append(field)
-
-        return missing
+        return [field for field, getter in _MANDATORY_FIELDS if not getter(claim_data)]
 
     def _check_fraud_indicators(self, claim_data: ClaimData) -> List[str]:
         """Check for fraud-related keywords and patterns."""
         flags = []
         
+        description = claim_data.incident_info.incident_description or ""
+        damage_description = claim_data.asset_details.damage_description or ""
+        notes = claim_data.processing_notes or ""
+
+        # Nothing to analyze (common for incomplete FNOLs)
+        if not (description or damage_description or notes):
+            return flags
+
         # Combine all text fields for analysis
-        text_to_analyze = " ".join(
-            [
-                claim_data.incident_info.incident_description or "",
-                claim_data.asset_details.damage_description or "",
-                claim_data.processing_notes or "",
-            ]
-        ).lower()
+        text_to_analyze = " ".join([description, damage_description, notes]).lower()
 
         for keyword in self.INVESTIGATION_KEYWORDS:
             if keyword in text_to_analyze:
@@ -110,20 +115,12 @@ class ClaimRouter:
 
         return flags
 
-    def _route_by_damage(self, claim_data: ClaimData) -> Tuple[str, str]:
-        """Determine routing based on damage amount."""
-        if not claim_data.asset_details.estimated_damage:
-            return "", ""
-
-        damage = claim_data.asset_details.estimated_damage
-
-        if damage < self.FAST_TRACK_THRESHOLD:
-            return ClaimRoute.FAST_TRACK.value, f"Estimated damage (${damage:,.2f}) qualifies for fast-track processing"
-
-        return "", ""
-
     def _determine_route(
-        self, claim_data: ClaimData, flags: List[str], missing_fields: List[str]
+        self,
+        claim_data: ClaimData,
+        fraud_flagged: bool,
+        missing_fields: List[str],
+        fast_track_eligible: bool,
     ) -> Tuple[ClaimRoute, float]:
         """
         Determine the final routing decision based on priority order:
@@ -141,7 +138,7 @@ class ClaimRouter:
             return ClaimRoute.SPECIALIST_QUEUE, confidence
 
         # Priority 2 (Rule 4.3): Fraud/Investigation flags → Investigation Flag
-        if "FRAUD_FLAG" in flags or "INVESTIGATION_FLAG" in flags:
+        if fraud_flagged:
             confidence = 0.90
             return ClaimRoute.INVESTIGATION_FLAG, confidence
 
@@ -151,11 +148,9 @@ class ClaimRouter:
             return ClaimRoute.MANUAL_REVIEW, confidence
 
         # Priority 4 (Rule 4.1): Damage < $25,000 → Fast-track
-        if claim_data.asset_details.estimated_damage:
-            damage = claim_data.asset_details.estimated_damage
-            if damage < self.FAST_TRACK_THRESHOLD:
-                confidence = 0.95
-                return ClaimRoute.FAST_TRACK, confidence
+        if fast_track_eligible:
+            confidence = 0.95
+            return ClaimRoute.FAST_TRACK, confidence
 
         # Default: Standard processing
         confidence = 0.80
@@ -164,9 +159,10 @@ class ClaimRouter:
     def validate_routing(self, claim_data: ClaimData, route: ClaimRoute) -> bool:
         """Validate that a routing decision is appropriate."""
         # All mandatory fields present
-        if not self._identify_missing_fields(claim_data):
+        missing_fields = self._identify_missing_fields(claim_data)
+        if not missing_fields:
             return True
         # If mandatory fields are missing but route is not manual review
-        if self._identify_missing_fields(claim_data) and route != ClaimRoute.MANUAL_REVIEW:
+        if route != ClaimRoute.MANUAL_REVIEW:
             return False
         return True
@@ -1,7 +1,13 @@
 """Unit tests for claim processing components."""
 
+import dataclasses
 import unittest
 import json
+import os
+import re
+import shutil
+import sys
+import tempfile
 from pathlib import Path
 
 from src.models import (
@@ -11,10 +17,79 @@ from src.models import (
     IncidentInfo,
     AssetDetails,
     ClaimRoute,
+    InvolvedParty,
 )
+from src import extractor
 from src.extractor import FieldExtractor
 from src.router import ClaimRouter
-from src.processor import ClaimProcessor
+from src.processor import ClaimProcessor, MIN_PARALLEL_BATCH
+
+
+def _split_alternatives(source):
+    """Split a regex source into (literal text, groups) per top-level branch."""
+    branches = [("", [])]
+    depth = start = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        literal, groups = branches[-1]
+        if char == "\\":
+            if depth == 0:
+                branches[-1] = (literal + source[i:i + 2], groups)
+            i += 2
+            continue
+        if char == "[":
+            # Skip character classes; they cannot spell a marker
+            i = source.index("]", i + 2) + 1
+            if depth == 0:
+                branches[-1] = (literal + " ", groups)
+            continue
+        if char == "(":
+            depth += 1
+            if depth == 1:
+                start = i + 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                optional = source[i + 1:i + 2] in ("?", "*") or source.startswith(
+                    "{0", i + 1
+                )
+                if not optional:
+                    groups.append(source[start:i])
+                branches[-1] = (literal + " ", groups)
+        elif char == "|" and depth == 0:
+            branches.append(("", []))
+        elif depth == 0:
+            branches[-1] = (literal + char, groups)
+        i += 1
+    return branches
+
+
+def _always_has_marker(source):
+    """Whether every way a lowercase regex can match contains a marker word."""
+    for literal, groups in _split_alternatives(source):
+        if any(marker in literal for marker in extractor._FIELD_MARKERS):
+            continue
+        # Otherwise a mandatory group must guarantee a marker
+        if not any(
+            _always_has_marker(re.sub(r"^\?:", "", group))
+            for group in groups
+        ):
+            return False
+    return True
+
+
+class TestModels(unittest.TestCase):
+    """Test data model serialization."""
+
+    def test_to_dict_covers_all_fields(self):
+        """Test that to_dict emits every dataclass field."""
+        for model in (PolicyInfo(), IncidentInfo(), InvolvedParty(), AssetDetails()):
+            with self.subTest(model=type(model).__name__):
+                self.assertEqual(
+                    set(model.to_dict()),
+                    {f.name for f in dataclasses.fields(model)},
+                )
 
 
 class TestFieldExtractor(unittest.TestCase):
@@ -54,6 +129,44 @@ class TestFieldExtractor(unittest.TestCase):
         claim_data = self.extractor.extract_from_text(text)
         self.assertEqual(claim_data.claim_type, ClaimType.COLLISION)
 
+    def test_extract_attachments_from_several_lines(self):
+        """Test that attachments found by different patterns are all kept."""
+        text = (
+            "Attachments: police report, repair estimate\n"
+            "Photos attached: front bumper damage and rear door\n"
+        )
+        claim_data = self.extractor.extract_from_text(text)
+        self.assertEqual(
+            claim_data.attachments,
+            [
+                "police report",
+                "repair estimate",
+                "front bumper damage and rear door",
+            ],
+        )
+
+    def test_extract_unrelated_text(self):
+        """Test that text without any field markers yields an empty claim."""
+        text = "Meeting notes: bring snacks on Friday."
+        claim_data = self.extractor.extract_from_text(text)
+        self.assertIsNone(claim_data.policy_info.policy_number)
+        self.assertEqual(claim_data.claim_type, ClaimType.UNKNOWN)
+        self.assertEqual(claim_data.extraction_confidence["policy_number"], 0.0)
+
+    def test_patterns_contain_field_marker(self):
+        """Test that every branch of every pattern survives the marker gate."""
+        patterns = [p for group in FieldExtractor.PATTERNS.values() for p in group]
+        for name, value in vars(extractor).items():
+            if name.endswith(("_PATTERN", "_PATTERNS")) and name not in (
+                "_RAW_PATTERNS",
+                "_NORMALIZE_PATTERN",
+            ):
+                patterns.extend(value if isinstance(value, tuple) else (value,))
+        self.assertGreater(len(patterns), len(FieldExtractor.PATTERNS))
+        for pattern in patterns:
+            with self.subTest(pattern=pattern.pattern):
+                self.assertTrue(_always_has_marker(pattern.pattern.lower()))
+
     def test_normalize_text(self):
         """Test text normalization."""
         text = "Field    name:   value\n\n  next  field"
@@ -90,6 +203,7 @@ class TestClaimRouter(unittest.TestCase):
         routing = self.router.route_claim(claim_data)
         self.assertEqual(routing.recommended_route, ClaimRoute.MANUAL_REVIEW)
         self.assertIn("MISSING_MANDATORY_FIELDS", routing.flags)
+        self.assertIn("policy_number", routing.missing_fields)
 
     def test_specialist_queue_bodily_injury(self):
         """Test specialist queue routing for bodily injury."""
@@ -177,6 +291,52 @@ class TestClaimProcessor(unittest.TestCase):
         self.assertIsInstance(dict_output, dict)
         self.assertIn("extractedFields", dict_output)
 
+    def test_export_to_file_after_directory_removed(self):
+        """Test exporting again after the output directory was deleted."""
+        result = self.processor.process_document("Policy Number: POL-001")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = os.path.join(tmp_dir, "out")
+            self.processor.export_to_file(result, os.path.join(output_dir, "a.json"))
+            shutil.rmtree(output_dir)
+
+            output_path = os.path.join(output_dir, "b.json")
+            self.processor.export_to_file(result, output_path)
+            with open(output_path) as f:
+                self.assertIn("extractedFields", json.load(f))
+
+    def test_process_batch_parallel(self):
+        """Test batch processing with worker processes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_paths = []
+            for i in range(MIN_PARALLEL_BATCH + 2):
+                file_path = os.path.join(tmp_dir, f"claim_{i:02d}.txt")
+                with open(file_path, "w") as f:
+                    f.write(f"Policy Number: POL-{i:04d}\n")
+                file_paths.append(file_path)
+            bad_path = os.path.join(tmp_dir, "missing.txt")
+            file_paths.insert(3, bad_path)
+
+            # Workers print errors to the inherited stdout descriptor
+            with tempfile.TemporaryFile(mode="w+") as log:
+                sys.stdout.flush()
+                saved_stdout = os.dup(1)
+                os.dup2(log.fileno(), 1)
+                try:
+                    results = self.processor.process_batch(file_paths, max_workers=2)
+                finally:
+                    sys.stdout.flush()
+                    os.dup2(saved_stdout, 1)
+                    os.close(saved_stdout)
+                log.seek(0)
+                output = log.read()
+
+        self.assertIn(f"Error processing {bad_path}", output)
+        self.assertEqual(
+            [r.extracted_fields["policy_info"]["policy_number"] for r in results],
+            [f"POL-{i:04d}" for i in range(MIN_PARALLEL_BATCH + 2)],
+        )
+        self.assertEqual(len({r.processing_timestamp for r in results}), 1)
+
 
 if __name__ == "__main__":
     unittest.main()